@@ -0,0 +1,3 @@
+# --- Lightweight core: numpy and pandas only (no scikit-learn, seaborn or matplotlib) ---
+from Librarian.models import WorldDataset, CobbDouglasFit, LinearFit
+from Librarian.cube import WorldCube
@@ -0,0 +1,127 @@
+# --- Import packages ---
+# --- altair is imported when a chart is drawn, so building the payload stays light ---
+import pandas as pd
+
+from Librarian.config import REGION_PALETTE
+from Librarian.models import CobbDouglasFit, LinearFit
+
+
+# -----------------------------------------------------------------------
+# ------------------- ALL-YEARS PAYLOAD (BUILT ONCE) --------------------
+# -----------------------------------------------------------------------
+
+
+def build_scatter_payload(world, x: str, y: str, fit=None,
+                          x_range=(100, 220000), n: int = 100) -> dict:
+    # --- Precompute every year's points (and fitted curves) for a client-side chart ---
+
+    # x, y    : indicator names for the two axes
+    # fit     : None, "cobb_douglas" or "linear"
+    # x_range : range of the fitted curves
+    # n       : number of points of each fitted curve
+
+    # --- Points: one row per country-year, only the columns the chart needs ---
+    panel = world.full_panel(required=[x, y])
+    points = pd.DataFrame({
+        "year": panel["year"].astype("int16"),
+        "country_code": panel["country_code"],
+        "name": panel["name"].fillna(panel["country_code"]),
+        "region_name": panel["region_name"],
+        "x": panel[x].astype("float32").round(2),
+        "y": panel[y].astype("float32").round(3),
+    })
+
+    # --- Curves: one fit per year, on all regions ---
+    curves = []
+    if fit is not None:
+        for year, group in points.groupby("year"):
+            if len(group) < 2:
+                continue
+
+            if fit == "cobb_douglas":
+                model = CobbDouglasFit.fit(x=group["x"], y=group["y"])
+                x_fit, y_fit = model.curve(x_min=x_range[0], x_max=x_range[1], n=n)
+                label = f"Cobb–Douglas (α = {model.alpha:.2f}, R² = {model.r2:.2f})"
+            elif fit == "linear":
+                model = LinearFit.fit(x=group["x"], y=group["y"])
+                x_fit, y_fit = model.curve(x_min=group["x"].min(), x_max=group["x"].max(), n=n)
+                label = f"Linear fit (R² = {model.r2:.2f})"
+            else:
+                raise ValueError(f"Unknown fit: {fit!r}")
+
+            curves.append(pd.DataFrame({"year": year, "x": x_fit, "y": y_fit, "label": label}))
+
+    curves = pd.concat(curves, ignore_index=True) if curves else None
+
+    return {"points": points.reset_index(drop=True), "curves": curves}
+
+
+# -----------------------------------------------------------------------
+# --------------------- ANIMATED SCATTER (ALTAIR) -----------------------
+# -----------------------------------------------------------------------
+
+
+def animated_scatter(payload: dict, x_title: str, y_title: str,
+                     x_domain, y_domain, title: str,
+                     log_x: bool = False, start_year=None, show_means: bool = False):
+    # --- Scatter with a year slider and clickable region legend, both handled by the browser ---
+    import altair as alt
+
+    # --- The payload holds every year at once, so it is bigger than Altair's default row limit ---
+    alt.data_transformers.disable_max_rows()
+
+    points = payload["points"]
+    years = points["year"]
+    if start_year is None:
+        start_year = int(years.min())
+
+    # --- Year slider: filters every layer in the browser ---
+    year_param = alt.param(
+        name="year",
+        value=start_year,
+        bind=alt.binding_range(min=int(years.min()), max=int(years.max()), step=1, name="Year "),
+    )
+
+    # --- Region toggle: click (shift+click for more) on the legend ---
+    region_sel = alt.selection_point(name="regions", fields=["region_name"], bind="legend")
+
+    x_scale = alt.Scale(type="log", domain=x_domain) if log_x else alt.Scale(domain=x_domain)
+    x_enc = alt.X("x:Q", title=x_title, scale=x_scale)
+    y_enc = alt.Y("y:Q", title=y_title, scale=alt.Scale(domain=y_domain))
+    color = alt.Color(
+        "region_name:N",
+        title="Region",
+        scale=alt.Scale(domain=list(REGION_PALETTE.keys()), range=list(REGION_PALETTE.values())),
+    )
+
+    base = (
+        alt.Chart(points)
+        .transform_filter(alt.datum.year == year_param)
+        .transform_filter(region_sel)
+    )
+
+    scatter = base.mark_circle(size=50, opacity=0.7).encode(
+        x=x_enc,
+        y=y_enc,
+        color=color,
+        tooltip=["name:N", "region_name:N", alt.Tooltip("x:Q", format=",.0f"), alt.Tooltip("y:Q", format=",.2f")],
+    ).add_params(year_param, region_sel)
+
+    layers = [scatter]
+
+    # --- Mean lines, recomputed client-side on the visible points ---
+    if show_means:
+        layers.append(base.mark_rule(color="red", strokeDash=[6, 4]).encode(x="mean(x):Q"))
+        layers.append(base.mark_rule(color="green", strokeDash=[6, 4]).encode(y="mean(y):Q"))
+
+    curves = payload.get("curves")
+    if curves is not None:
+        curve = (
+            alt.Chart(curves)
+            .transform_filter(alt.datum.year == year_param)
+            .mark_line(color="orange", strokeWidth=2, clip=True)
+            .encode(x=x_enc, y=y_enc, tooltip=["label:N"])
+        )
+        layers.append(curve)
+
+    return alt.layer(*layers).properties(title=title, height=420)
@@ -33,3 +33,6 @@ REGION_PALETTE = {
     "Other": "gray"
 }
 
+# --- Storage of the downloaded data: "panel" (pandas dataframe) or "cube" ---
+# --- (dense numpy array, see Librarian/cube.py and benchmarks/storage.py) ---
+STORAGE_BACKEND = "panel"
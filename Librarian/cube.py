@@ -0,0 +1,202 @@
+# --- Import packages ---
+import numpy as np
+import pandas as pd
+
+from Librarian.config import REGION_NAME_MAP
+from Librarian.models import WorldDataset, _panel_to_grid
+
+
+class WorldCube(WorldDataset):
+    # --- Same API as WorldDataset, but the values are stored in one dense ---
+    # --- float array shaped (indicator, country, year), NaN where missing. ---
+
+    # Snapshots are pandas views on the array (no copy of the values when no
+    # country has to be dropped), time series and aggregates are plain array
+    # indexing and axis reductions. The panel is kept for the methods that
+    # are not overridden here (e.g. the gap-filled snapshots).
+
+    # The cube is read-only, so writing into a snapshot raises an error
+    # instead of changing the data. Load it with st.cache_resource (shared
+    # object), not st.cache_data (a pickled copy for every call).
+
+    def __init__(self, panel: pd.DataFrame, meta: pd.DataFrame, indicators: dict):
+        super().__init__(panel, meta, indicators)
+        self._build_cube()
+
+    def __setstate__(self, state):
+        # --- Unpickled arrays are writeable again: restore the protection ---
+        self.__dict__.update(state)
+        self.cube.flags.writeable = False
+
+    # -----------------------------------------------------------------------
+    # ------------------------- BUILD THE CUBE ------------------------------
+    # -----------------------------------------------------------------------
+
+    def _build_cube(self):
+        names = [c for c in self.panel.columns if c not in ("country_code", "year")]
+        codes, years, values = _panel_to_grid(self.panel, names)
+
+        # --- Snapshots are views on the cube: make sure nobody writes into it ---
+        values.flags.writeable = False
+
+        self.cube = values                          # (indicator, country, year)
+        self.mask = ~np.isnan(values)               # observed values
+
+        # --- (country, year) pairs that are rows of the panel ---
+        self.present = np.zeros(values.shape[1:], dtype=bool)
+        self.present[
+            np.searchsorted(codes, self.panel["country_code"].to_numpy()),
+            self.panel["year"].to_numpy() - years[0],
+        ] = True
+
+        # --- Integer code maps: position on each axis ---
+        self.indicator_names = np.array(names, dtype=object)
+        self.country_codes = np.asarray(codes, dtype=object)
+        self.years = years
+        self.indicator_index = {name: i for i, name in enumerate(names)}
+        self.country_index = {code: i for i, code in enumerate(self.country_codes)}
+
+        # --- Built once, reused by every snapshot (pandas would infer them each time), ---
+        # --- with the same dtypes and column name as the panel ---
+        self._columns = pd.Index(names, name=self.panel.columns.name)
+        self._codes_array = pd.Series(self.country_codes, dtype=self.panel["country_code"].dtype).array
+
+        # --- Metadata aligned with the country axis (same columns as the merge) ---
+        meta_aligned = self.meta.set_index("id", drop=False).reindex(self.country_codes)
+        self._meta_columns = {col: meta_aligned[col].array for col in meta_aligned.columns}
+
+        region_names = meta_aligned["region"].map(REGION_NAME_MAP).fillna("Other")
+        self.region_names, self.country_region = np.unique(
+            region_names.to_numpy(dtype=object), return_inverse=True
+        )
+        self._region_array = region_names.array
+
+    def _year_position(self, year: int):
+        # --- Position of a year on the year axis, None if outside the cube ---
+        yi = int(year) - int(self.years[0])
+        return yi if 0 <= yi < len(self.years) else None
+
+    def _indicator_positions(self, indicators) -> np.ndarray:
+        missing = [i for i in indicators if i not in self.indicator_index]
+        if missing:
+            raise KeyError(f"Unknown indicators: {missing}")
+        return np.array([self.indicator_index[i] for i in indicators], dtype=int)
+
+    def _year_view(self, yi: int, required=None):
+        # --- One year of the cube as a DataFrame, plus the rows to keep ---
+
+        # --- Countries without data that year, or missing a required indicator ---
+        keep = self.present[:, yi]
+        if required is not None:
+            keep = keep & self.mask[self._indicator_positions(required), :, yi].all(axis=0)
+
+        if keep.all():
+            keep = None     # no row to drop: the values stay a view on the cube
+            values, codes = self.cube[:, :, yi], self._codes_array
+        else:
+            values, codes = self.cube[:, keep, yi], self._codes_array[keep]
+
+        df = pd.DataFrame(values.T, columns=self._columns, copy=False)
+        df.insert(0, "country_code", codes)
+        df.insert(1, "year", int(self.years[yi]))
+
+        return df, keep
+
+    # -----------------------------------------------------------------------
+    # ------------------------ BUILD THE SNAPSHOT ---------------------------
+    # -----------------------------------------------------------------------
+
+    def snapshot(self, year: int, dropna_cols=None, filled=False) -> pd.DataFrame:
+        # --- Return a dataframe for a single year, read from the cube ---
+
+        yi = self._year_position(year)
+        if filled or yi is None:
+            return super().snapshot(year, dropna_cols=dropna_cols, filled=filled)
+
+        df, _ = self._year_view(yi, required=dropna_cols)
+        return df
+
+    def full_snapshot(self, year: int, required=None, filled=False) -> pd.DataFrame:
+        # --- Snapshot with name and region: metadata is already aligned, no merge ---
+
+        yi = self._year_position(year)
+        if filled or yi is None:
+            return super().full_snapshot(year, required=required, filled=filled)
+
+        snap, keep = self._year_view(yi, required=required)
+
+        for col, values in self._meta_columns.items():
+            snap[col] = values if keep is None else values[keep]
+
+        snap["region_name"] = self._region_array if keep is None else self._region_array[keep]
+        snap.columns.name = None    # as after the merge of the panel path
+
+        return snap
+
+    # -----------------------------------------------------------------------
+    # ------------------ COUNTRY TIME SERIES --------------------------------
+    # -----------------------------------------------------------------------
+
+    def series(self, countries=None, indicators=None, years=None) -> pd.DataFrame:
+        # --- Return the time series of one or more countries, read from the cube ---
+
+        if countries is None:
+            countries = list(self.country_codes)
+        elif isinstance(countries, str):
+            countries = [countries]
+
+        if indicators is None:
+            indicators = list(self.indicator_names)
+        elif isinstance(indicators, str):
+            indicators = [indicators]
+
+        for code in countries:
+            if code not in self.country_index:
+                raise KeyError(f"Unknown country code: {code}")
+
+        ci = np.array([self.country_index[code] for code in countries], dtype=int)
+        ii = self._indicator_positions(indicators)
+        if years is None:
+            yi = np.arange(len(self.years))
+        else:
+            yi = np.unique(np.asarray(list(years), dtype=int)) - self.years[0]
+            yi = yi[(yi >= 0) & (yi < len(self.years))]
+
+        # --- Only the requested block is copied out of the cube ---
+        block = self.cube[np.ix_(ii, ci, yi)]
+        keep = self.present[np.ix_(ci, yi)].ravel()
+
+        block = block.reshape(len(ii), -1)[:, keep]
+
+        # --- One float block for all indicators, like the snapshot views ---
+        df = pd.DataFrame(block.T, columns=pd.Index(indicators, name=self._columns.name), copy=False)
+        df.insert(0, "country_code", np.repeat(self._codes_array[ci], len(yi))[keep])
+        df.insert(1, "year", np.tile(self.years[yi], len(ci))[keep])
+
+        return df
+
+    # -----------------------------------------------------------------------
+    # -------------------------- AGGREGATES ---------------------------------
+    # -----------------------------------------------------------------------
+
+    def region_mean(self, indicator: str) -> pd.DataFrame:
+        # --- Mean of an indicator by region and year, ignoring missing values ---
+        # --- One reduction over the country axis for every year at once ---
+
+        i = self._indicator_positions([indicator])[0]
+        observed = self.mask[i]
+
+        sums = np.zeros((len(self.region_names), len(self.years)))
+        counts = np.zeros_like(sums)
+        np.add.at(sums, self.country_region, np.where(observed, self.cube[i], 0.0))
+        np.add.at(counts, self.country_region, observed)
+
+        with np.errstate(invalid="ignore"):
+            means = sums / counts
+
+        # --- Same labels as the groupby of the panel path ---
+        return pd.DataFrame(
+            means,
+            index=pd.Index(list(self.region_names), name="region_name"),
+            columns=pd.Index(self.years, name="year"),
+        )
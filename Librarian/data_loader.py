@@ -1,9 +1,32 @@
 import streamlit as st
 from Librarian.models import WorldDataset
-from Librarian.config import INDICATORS
+from Librarian.cube import WorldCube
+from Librarian.config import INDICATORS, STORAGE_BACKEND
+from Librarian.charts import build_scatter_payload
+
+def _download_world(dataset):
+    """Download the World Bank panel and build the gap-filled copy."""
+    world = dataset.from_api(INDICATORS, years=range(2000, 2023))
+    world.fill_gaps()   # gap-filled panel, built once and cached with the data
+    return world
 
 @st.cache_data
+def _load_panel_world():
+    """Download and cache the World Bank panel (a copy for every call)."""
+    return _download_world(WorldDataset)
+
+@st.cache_resource
+def _load_cube_world():
+    """Download and cache the World Bank cube (one shared, read-only object)."""
+    return _download_world(WorldCube)
+
 def load_world():
     """Download and cache the World Bank panel."""
-    world = WorldDataset.from_api(INDICATORS, years=range(2000, 2023))
-    return world
\ No newline at end of file
+    if STORAGE_BACKEND == "cube":
+        return _load_cube_world()
+    return _load_panel_world()
+
+@st.cache_data
+def load_scatter_payload(x, y, fit=None, x_range=(100, 220000)):
+    """Build and cache the all-years payload used by the client-side charts."""
+    return build_scatter_payload(load_world(), x, y, fit=fit, x_range=x_range)
\ No newline at end of file
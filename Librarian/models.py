@@ -1,8 +1,20 @@
 # --- Import packages ---
-import wbgapi as wb
+# --- Only numpy and pandas here: wbgapi is imported when downloading, ---
+# --- plotting libraries are imported by the pages when drawing ---
 import pandas as pd
 import numpy as np
-from sklearn.metrics import r2_score
+
+
+def r2_score(y_true, y_pred) -> float:
+    # --- Coefficient of determination, same as sklearn.metrics.r2_score ---
+    y_true = np.asarray(y_true, dtype=float)
+    y_pred = np.asarray(y_pred, dtype=float)
+    ss_res = ((y_true - y_pred) ** 2).sum()
+    ss_tot = ((y_true - y_true.mean()) ** 2).sum()
+    if ss_tot == 0:
+        # --- Constant y_true: perfect fit 1.0, otherwise 0.0 (as sklearn) ---
+        return 1.0 if ss_res == 0 else 0.0
+    return 1 - ss_res / ss_tot
 
 
 class WorldDataset:
@@ -10,10 +22,35 @@ class WorldDataset:
     # --- and one with meta data ---
 
     def __init__(self, panel: pd.DataFrame, meta: pd.DataFrame, indicators: dict):
-        self.panel = panel
+        # --- Panel sorted by country and year, so each country is one block of rows ---
+        self.panel = panel.sort_values(["country_code", "year"], kind="stable").reset_index(drop=True)
         self.meta = meta
         self.indicators = indicators
 
+        # --- Gap-filled panel, built by fill_gaps() ---
+        self.filled_panel = None
+
+        self._build_country_index()
+
+    # -----------------------------------------------------------------------
+    # ----------------------- COUNTRY INDEX ---------------------------------
+    # -----------------------------------------------------------------------
+
+    def _build_country_index(self):
+        # --- Row range [start, stop) of every country in the sorted panel ---
+        codes = self.panel["country_code"].to_numpy()
+        self._years = self.panel["year"].to_numpy()
+
+        if len(codes) == 0:
+            self._country_rows = {}
+            return
+
+        starts = np.flatnonzero(np.r_[True, codes[1:] != codes[:-1]])
+        stops = np.r_[starts[1:], len(codes)]
+        self._country_rows = {
+            code: (start, stop) for code, start, stop in zip(codes[starts], starts, stops)
+        }
+
     # -----------------------------------------------------------------------
     # ----------------- DOWNLOAD DATA FROM WB API ---------------------------
     # -----------------------------------------------------------------------
@@ -22,6 +59,7 @@ class WorldDataset:
     @classmethod
     def from_api(cls, indicators: dict, years=2021) -> "WorldDataset":
         # --- Download the chosen indicators with the WB api and build the dataframe ---
+        import wbgapi as wb
 
         # --- Load and clean country metadata ---
         meta = wb.economy.DataFrame()
@@ -86,10 +124,12 @@ class WorldDataset:
     # -----------------------------------------------------------------------
 
 
-    def snapshot(self, year: int, dropna_cols=None) -> pd.DataFrame:
+    def snapshot(self, year: int, dropna_cols=None, filled=False) -> pd.DataFrame:
         # --- Return a dataframe for a single year ---
-        
-        df = self.panel[self.panel["year"] == year].copy() 
+        # --- filled=True reads the gap-filled panel (see fill_gaps) ---
+
+        panel = self._get_panel(filled)
+        df = panel[panel["year"] == year].copy()
         if dropna_cols is not None:     # Removes the countries with no data
             df = df.dropna(subset=dropna_cols)
         return df
@@ -113,10 +153,10 @@ class WorldDataset:
     # ------------- MAP REGION NAME AND COLOR TO COUNTRIES ------------------ previously done in every page
     # -----------------------------------------------------------------------
 
-    def full_snapshot(self, year: int, required=None) -> pd.DataFrame:
+    def full_snapshot(self, year: int, required=None, filled=False) -> pd.DataFrame:
 
         # Get the basic snapshot
-        snap = self.snapshot(year, dropna_cols=required)
+        snap = self.snapshot(year, dropna_cols=required, filled=filled)
 
         # Merge with metadata
         snap = snap.merge(
@@ -131,6 +171,251 @@ class WorldDataset:
 
         return snap
 
+    # -----------------------------------------------------------------------
+    # ---------------- FULL PANEL (ALL YEARS, WITH REGIONS) -----------------
+    # -----------------------------------------------------------------------
+
+    def full_panel(self, required=None, filled=False) -> pd.DataFrame:
+        # --- Same as full_snapshot, but for every year at once ---
+        # --- (one merge instead of one per year) ---
+
+        panel = self._get_panel(filled)
+        if required is not None:    # Removes the country-years with no data
+            panel = panel.dropna(subset=required)
+
+        panel = panel.merge(
+            self.meta,
+            left_on="country_code",
+            right_on="id",
+            how="left")
+
+        from Librarian.config import REGION_NAME_MAP
+        panel["region_name"] = panel["region"].map(REGION_NAME_MAP).fillna("Other")
+
+        return panel
+
+    # -----------------------------------------------------------------------
+    # ------------------ COUNTRY TIME SERIES --------------------------------
+    # -----------------------------------------------------------------------
+
+    def series(self, countries=None, indicators=None, years=None) -> pd.DataFrame:
+        # --- Return the time series of one or more countries ---
+        # --- Rows are read from the country index, so the cost depends on ---
+        # --- the number of rows returned, not on the size of the panel ---
+
+        # countries  : a country code, a list of codes, or None for all countries
+        # indicators : an indicator name, a list of names, or None for all indicators
+        # years      : an iterable of years (e.g. range(2005, 2021)), or None for all years
+
+        if countries is None:
+            countries = list(self._country_rows)
+        elif isinstance(countries, str):
+            countries = [countries]
+
+        if indicators is None:
+            indicators = [c for c in self.panel.columns if c not in ("country_code", "year")]
+        elif isinstance(indicators, str):
+            indicators = [indicators]
+
+        if years is not None:
+            years = np.unique(np.asarray(list(years), dtype=int))
+
+        # --- Column positions, resolved once ---
+        positions = self.panel.columns.get_indexer(["country_code", "year", *indicators])
+        if (positions < 0).any():
+            missing = [i for i, pos in zip(indicators, positions[2:]) if pos < 0]
+            raise KeyError(f"Unknown indicators: {missing}")
+
+        # --- Collect the row ranges of every country ---
+        blocks = []
+        for code in countries:
+            if code not in self._country_rows:
+                raise KeyError(f"Unknown country code: {code}")
+            start, stop = self._country_rows[code]
+
+            if years is not None and len(years) > 0:
+                # --- Years are sorted inside each block: keep only the window ---
+                block = self._years[start:stop]
+                stop = start + np.searchsorted(block, years[-1], side="right")
+                start = start + np.searchsorted(block, years[0], side="left")
+
+            blocks.append((start, stop))
+
+        if len(blocks) == 1 and years is None:
+            # --- A single country is a plain slice of the panel ---
+            rows = slice(*blocks[0])
+        elif blocks:
+            rows = np.concatenate([np.arange(start, stop) for start, stop in blocks])
+        else:
+            rows = np.array([], dtype=int)
+
+        # --- Drop the years missing from the window (e.g. years=[2000, 2020]) ---
+        if years is not None:
+            rows = rows[np.isin(self._years[rows], years)]
+
+        # --- Rows and columns in one selection: only the returned cells are copied ---
+        df = self.panel.iloc[rows, positions]
+        df.index = pd.RangeIndex(len(df))
+        return df
+
+    # -----------------------------------------------------------------------
+    # -------------------- GROWTH RATES AND CAGR ----------------------------
+    # -----------------------------------------------------------------------
+
+    def growth(self, indicators, countries=None, years=None) -> pd.DataFrame:
+        # --- Annual growth rate of each indicator (0.05 = +5% per year) ---
+        # --- computed against the previous available year of the same country. ---
+        # --- If years are missing in between, the rate is annualized over the gap. ---
+
+        if isinstance(indicators, str):
+            indicators = [indicators]
+
+        df = self.series(countries, indicators, years)
+
+        # --- Rows are sorted by country and year: compare every row with the one above ---
+        same_country = df["country_code"].eq(df["country_code"].shift(1))
+        gap = df["year"] - df["year"].shift(1)
+
+        # --- Growth is undefined from or to zero or negative values ---
+        values = df[indicators].where(df[indicators] > 0)
+        ratio = values / values.shift(1)
+        rates = ratio.pow(1 / gap, axis=0) - 1
+        rates = rates.where(same_country, axis=0)
+
+        return pd.concat([df[["country_code", "year"]], rates], axis=1)
+
+    def cagr(self, indicators, start: int, end: int, countries=None) -> pd.DataFrame:
+        # --- Compound annual growth rate between two years, one row per country ---
+
+        #    CAGR = (value_end / value_start) ^ (1 / (end - start)) - 1
+
+        if isinstance(indicators, str):
+            indicators = [indicators]
+        if end <= start:
+            raise ValueError("end must be after start")
+
+        df = self.series(countries, indicators, years=[start, end])
+
+        first = df[df["year"] == start].set_index("country_code")[indicators]
+        last = df[df["year"] == end].set_index("country_code")[indicators]
+
+        # --- Undefined from or to zero or negative values ---
+        ratio = last.where(last > 0) / first.where(first > 0)
+        return ratio ** (1 / (end - start)) - 1
+
+    # -----------------------------------------------------------------------
+    # -------------------------- AGGREGATES ---------------------------------
+    # -----------------------------------------------------------------------
+
+    def region_mean(self, indicator: str) -> pd.DataFrame:
+        # --- Mean of an indicator by region (rows) and year (columns), ignoring missing values ---
+        if indicator not in self.panel.columns:
+            raise KeyError(f"Unknown indicators: {[indicator]}")
+
+        means = self.full_panel().groupby(["region_name", "year"])[indicator].mean().unstack()
+
+        # --- Every year of the panel as a column, even when no region has a value ---
+        years = np.arange(self.panel["year"].min(), self.panel["year"].max() + 1)
+        return means.reindex(columns=pd.Index(years, name="year"))
+
+    # -----------------------------------------------------------------------
+    # ------------------------ GAP FILLING ----------------------------------
+    # -----------------------------------------------------------------------
+
+    def fill_gaps(self, ffill_limit: int = 3) -> "WorldDataset":
+        # --- Build the gap-filled panel once (called at load time) ---
+
+        # Missing years between two observations of a country are filled by
+        # linear interpolation, missing years after the last observation are
+        # forward-filled for at most ffill_limit years. Years before the first
+        # observation stay empty. For every indicator a boolean column
+        # "<indicator>_imputed" marks the filled values.
+
+        indicators = [c for c in self.panel.columns if c not in ("country_code", "year")]
+
+        # --- (country x year) grid: one 2-D array per indicator ---
+        codes, years, values = _panel_to_grid(self.panel, indicators)
+
+        filled, imputed = _fill_grid(values, ffill_limit)
+
+        # --- Keep only the country-years with at least one value ---
+        has_value = ~np.isnan(filled).all(axis=0).ravel()
+
+        # --- Back to the panel layout, sorted by country and year: ---
+        # --- one block for the values, one for the flags, joined once ---
+        keys = pd.DataFrame({
+            "country_code": np.repeat(codes, len(years))[has_value],
+            "year": np.tile(years, len(codes))[has_value],
+        })
+        values = pd.DataFrame(
+            filled.reshape(len(indicators), -1)[:, has_value].T,
+            columns=indicators,
+        )
+        flags = pd.DataFrame(
+            imputed.reshape(len(indicators), -1)[:, has_value].T,
+            columns=[f"{name}_imputed" for name in indicators],
+        )
+        self.filled_panel = pd.concat([keys, values, flags], axis=1)
+
+        return self
+
+    def _get_panel(self, filled: bool) -> pd.DataFrame:
+        # --- Original panel, or the gap-filled one (built on first use if needed) ---
+        if not filled:
+            return self.panel
+        if self.filled_panel is None:
+            self.fill_gaps()
+        return self.filled_panel
+
+
+def _panel_to_grid(panel: pd.DataFrame, indicators: list):
+    # --- Dense (indicator, country, year) array from the panel, NaN where missing ---
+    # --- Returns the sorted country codes, the years and the array ---
+
+    codes, country_idx = np.unique(panel["country_code"].to_numpy(), return_inverse=True)
+    panel_years = panel["year"].to_numpy()
+    years = np.arange(panel_years.min(), panel_years.max() + 1)
+
+    values = np.full((len(indicators), len(codes), len(years)), np.nan)
+    values[:, country_idx, panel_years - years[0]] = panel[indicators].to_numpy(dtype=float).T
+
+    return codes, years, values
+
+
+def _fill_grid(values: np.ndarray, ffill_limit: int):
+    # --- Fill the NaN of an (..., year) array along the last axis ---
+    # --- Returns the filled array and the mask of the filled cells ---
+
+    n_years = values.shape[-1]
+    t = np.arange(n_years)
+    observed = ~np.isnan(values)
+
+    # --- Position of the previous and the next observation of every cell ---
+    prev_idx = np.maximum.accumulate(np.where(observed, t, -1), axis=-1)
+    next_idx = np.flip(
+        np.minimum.accumulate(np.flip(np.where(observed, t, n_years), axis=-1), axis=-1),
+        axis=-1,
+    )
+
+    has_prev = prev_idx >= 0
+    has_next = next_idx < n_years
+    prev_val = np.take_along_axis(values, np.where(has_prev, prev_idx, 0), axis=-1)
+    next_val = np.take_along_axis(values, np.where(has_next, next_idx, 0), axis=-1)
+
+    # --- Linear interpolation between two observations ---
+    interior = ~observed & has_prev & has_next
+    with np.errstate(invalid="ignore", divide="ignore"):
+        weight = (t - prev_idx) / (next_idx - prev_idx)
+    interpolated = prev_val + weight * (next_val - prev_val)
+
+    # --- Bounded forward fill after the last observation ---
+    trailing = ~observed & has_prev & ~has_next & (t - prev_idx <= ffill_limit)
+
+    filled = np.where(interior, interpolated, values)
+    filled = np.where(trailing, prev_val, filled)
+
+    return filled, interior | trailing
+
 
 
 
@@ -192,5 +477,50 @@ class CobbDouglasFit:
         x_fit = np.linspace(x_min, x_max, n)
         y_fit = self.predict(x_fit)
         return x_fit, y_fit
-    
-    
\ No newline at end of file
+
+
+class LinearFit:
+    # --- Fit and represent a linear relationship:
+
+    #    Y = intercept + slope * X
+
+    # using ordinary least squares. ---
+
+    def __init__(self, intercept: float, slope: float, r2: float):
+        # Parameters:
+
+        # intercept : Value of Y at X = 0
+        # slope : Change of Y for one unit of X
+        # r2 : R² of the fit
+
+        self.intercept = intercept
+        self.slope = slope
+        self.r2 = r2
+
+    @classmethod
+    def fit(cls, x: pd.Series, y: pd.Series) -> "LinearFit":
+
+        # --- Convert to numpy arrays ---
+        x = np.asarray(x, dtype=float)
+        y = np.asarray(y, dtype=float)
+
+        # --- polyfit fits a line ---
+        slope, intercept = np.polyfit(x, y, 1)
+
+        # --- Compute R2 in order to check if the line fits the data ---
+        r2 = r2_score(y, intercept + slope * x)
+
+        return cls(intercept=intercept, slope=slope, r2=r2)
+
+    def predict(self, x: np.ndarray) -> np.ndarray:
+        # --- Predict Y values given X using the fitted line ---
+
+        x = np.asarray(x, dtype=float)
+        return self.intercept + self.slope * x
+
+    def curve(self, x_min: float, x_max: float, n: int = 200):
+
+        # --- Generate a line for plotting ---
+        x_fit = np.linspace(x_min, x_max, n)
+        y_fit = self.predict(x_fit)
+        return x_fit, y_fit
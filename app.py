@@ -2,11 +2,10 @@
 import sys
 sys.path.append("..")   # go up one directory so Python sees Librarian/
 
-from Librarian.data_loader import load_world
+from Librarian.data_loader import load_world, load_scatter_payload
+from Librarian.charts import animated_scatter
 from Librarian.models import WorldDataset, CobbDouglasFit
 from Librarian.config import REGION_PALETTE, REGION_NAME_MAP
-import matplotlib.pyplot as plt
-import seaborn as sns
 import streamlit as st
 
 
@@ -31,28 +30,33 @@ col_left, col_right = st.columns([3, 2])
 # Create the slider
 with col_right:
     st.subheader("Options")
-    year = st.slider("Select a year", min_value=2000, max_value=2022, value=2000, step=1)
+    # Interactive mode: all years are sent once, year and regions are then changed in the browser
+    interactive = st.checkbox("Interactive mode (year and regions in the chart)", value=False)
+    if not interactive:
+        year = st.slider("Select a year", min_value=2000, max_value=2022, value=2000, step=1)
 
 
 
 # --- BUILD SNAPSHOT FOR SELECTED YEAR ---
 
-snapshot = world.full_snapshot(year,required=["energy_use_per_capita", "life_expectancy"])
+if not interactive:
+    snapshot = world.full_snapshot(year,required=["energy_use_per_capita", "life_expectancy"])
 
 with col_right:
-    # Region filter
-    all_regions = sorted(snapshot["region_name"].dropna().unique())
-    selected_regions = st.multiselect(
-        "Choose regions to plot",
-        options=all_regions,
-        default=all_regions,
-    )
+    if not interactive:
+        # Region filter
+        all_regions = sorted(snapshot["region_name"].dropna().unique())
+        selected_regions = st.multiselect(
+            "Choose regions to plot",
+            options=all_regions,
+            default=all_regions,
+        )
 
     # Cobb Douglass button
     show_cobb = st.checkbox("Cobb–Douglas fit", value=False)
     use_log_scale = st.checkbox("Log scale on energy axis", value=False)
 
-if selected_regions:  # if user deselects everything, keep empty
+if not interactive and selected_regions:  # if user deselects everything, keep empty
     snapshot = snapshot[snapshot["region_name"].isin(selected_regions)]
 
 with col_right:
@@ -72,7 +76,34 @@ with col_right:
 
 
 
+# --- CLIENT-SIDE CHART ---
+if interactive:
+    payload = load_scatter_payload(
+        "energy_use_per_capita", "life_expectancy",
+        fit="cobb_douglas" if show_cobb else None,
+        x_range=(0, 220000),    # same curve as the static chart
+    )
+    chart = animated_scatter(
+        payload,
+        x_title="Energy consumption per capita (kWh / year)",
+        y_title="Life expectancy (years)",
+        x_domain=[100, 220000] if use_log_scale else [0, 220000],
+        y_domain=[45, 85],
+        title="Energy consumption and Life Expectancy",
+        log_x=use_log_scale,
+        show_means=True,
+    )
+    with col_left:
+        st.altair_chart(chart, use_container_width=True)
+        st.caption("Click a region in the legend to isolate it (shift+click for more). "
+                   "The Cobb–Douglas fit is computed on all regions.")
+    st.stop()
+
+
 # --- PLOT SCATTER ---
+# Plotting libraries are imported only when the chart is drawn
+import matplotlib.pyplot as plt
+import seaborn as sns
 
 fig, ax = plt.subplots(figsize=(6.5, 4)) # Dimesions
 sns.scatterplot(
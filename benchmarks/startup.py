@@ -0,0 +1,128 @@
+# --- Startup benchmark: import time and time to first render of every page ---
+
+# Usage (from the repository root):
+#     python benchmarks/startup.py
+#     python benchmarks/startup.py --budget 3.0    # exit with an error if a page is slower
+
+# Every measure runs in a fresh interpreter, so nothing is already imported.
+# The World Bank download is done (and cached) before the page timer starts,
+# so "first render" measures imports + snapshot + fit + plot, not the network.
+
+import argparse
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+PAGES = [
+    "app.py",
+    "pages/Energy_emission.py",
+    "pages/energy_threshold.py",
+    "pages/sustainable_energy.py",
+    "pages/energy_trajectories.py",
+]
+
+# --- Modules that the lightweight core must not load ---
+HEAVY_MODULES = ["sklearn", "seaborn", "matplotlib", "altair"]
+
+CORE_MODULES = ["Librarian", "Librarian.models", "Librarian.charts", "Librarian.data_loader"]
+
+
+# -----------------------------------------------------------------------
+# ----------------------- RUN IN A FRESH PROCESS ------------------------
+# -----------------------------------------------------------------------
+
+
+def _run(code: str) -> dict:
+    # --- Run a snippet in a new interpreter and read back the JSON it prints ---
+    out = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+    )
+    if out.returncode != 0:
+        # --- Keep the last line of the traceback (e.g. no network for the download) ---
+        raise RuntimeError(out.stderr.strip().splitlines()[-1])
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def import_time(module: str) -> dict:
+    # --- Seconds to import a module, and which heavy modules it pulled in ---
+    code = f"""
+import json, sys, time
+sys.path.insert(0, ".")
+t = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - t
+heavy = [m for m in {HEAVY_MODULES!r} if m in sys.modules]
+print(json.dumps({{"seconds": elapsed, "heavy": heavy}}))
+"""
+    return _run(code)
+
+
+def first_render(page: str) -> dict:
+    # --- Seconds for the first run of a page, with the data already in the cache ---
+    code = f"""
+import json, sys, time
+sys.path.insert(0, ".")
+from streamlit.testing.v1 import AppTest
+from Librarian.data_loader import load_world
+
+t = time.perf_counter()
+load_world()
+data = time.perf_counter() - t
+
+at = AppTest.from_file({str(ROOT / page)!r}, default_timeout=600)
+t = time.perf_counter()
+at.run()
+render = time.perf_counter() - t
+
+print(json.dumps({{"data": data, "seconds": render, "errors": [str(e.value) for e in at.exception]}}))
+"""
+    return _run(code)
+
+
+# -----------------------------------------------------------------------
+# ------------------------------- MAIN ----------------------------------
+# -----------------------------------------------------------------------
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Startup benchmark of the Streamlit pages")
+    parser.add_argument("--budget", type=float, default=None,
+                        help="fail if a page takes longer than this (seconds) to first render")
+    parser.add_argument("--skip-render", action="store_true",
+                        help="only measure import times (no download)")
+    args = parser.parse_args()
+
+    failed = False
+
+    print("Import time (fresh interpreter)")
+    for module in CORE_MODULES:
+        res = import_time(module)
+        print(f"  {module:<24} {res['seconds']:7.3f} s   heavy: {', '.join(res['heavy']) or '-'}")
+        if res["heavy"]:
+            failed = True
+
+    if not args.skip_render:
+        print("Time to first render (data already cached)")
+        for page in PAGES:
+            try:
+                res = first_render(page)
+            except RuntimeError as err:
+                print(f"  {page:<30} failed: {err}")
+                failed = True
+                continue
+            status = "ERROR" if res["errors"] else "ok"
+            print(f"  {page:<30} {res['seconds']:7.3f} s   (download {res['data']:.1f} s)  {status}")
+            if res["errors"] or (args.budget is not None and res["seconds"] > args.budget):
+                failed = True
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
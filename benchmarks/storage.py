@@ -0,0 +1,154 @@
+# --- Storage benchmark: pandas panel (WorldDataset) vs dense cube (WorldCube) ---
+
+# Usage (from the repository root):
+#     python benchmarks/storage.py
+#     python benchmarks/storage.py --indicators 1500 --countries 217 --years 64
+
+# The data is random but has the shape of the full WDI catalogue
+# (~1,500 indicators, 217 economies, 1960-2023) with a share of missing
+# values, so no download is needed. Both backends get the same panel.
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from Librarian.config import REGION_NAME_MAP
+from Librarian.cube import WorldCube
+from Librarian.models import WorldDataset
+
+
+# -----------------------------------------------------------------------
+# ------------------------- SYNTHETIC DATA ------------------------------
+# -----------------------------------------------------------------------
+
+
+def make_data(n_indicators: int, n_countries: int, n_years: int, missing: float, seed: int = 0):
+    # --- Panel (country_code, year, indicators...) and metadata (id, region, name) ---
+    rng = np.random.default_rng(seed)
+
+    codes = np.array([f"C{i:03d}" for i in range(n_countries)], dtype=object)
+    regions = list(REGION_NAME_MAP)
+    meta = pd.DataFrame({
+        "id": codes,
+        "region": [regions[i % len(regions)] for i in range(n_countries)],
+        "name": [f"Country {i}" for i in range(n_countries)],
+    })
+
+    years = np.arange(2023 - n_years + 1, 2024)
+    values = rng.lognormal(3, 1, (n_countries * n_years, n_indicators))
+    values[rng.random(values.shape) < missing] = np.nan
+
+    names = [f"indicator_{i}" for i in range(n_indicators)]
+    panel = pd.DataFrame(values, columns=names)
+    panel.insert(0, "country_code", np.repeat(codes, n_years))
+    panel.insert(1, "year", np.tile(years, n_countries))
+
+    return panel, meta, {name: name for name in names}
+
+
+# -----------------------------------------------------------------------
+# ----------------------------- PARITY ----------------------------------
+# -----------------------------------------------------------------------
+
+
+def check_parity(world: WorldDataset, cube: WorldCube, year: int, names: list):
+    # --- Both backends must return the same frames (values, columns and dtypes) ---
+    # --- Row labels differ (panel rows vs cube positions), so they are reset ---
+    def same(a: pd.DataFrame, b: pd.DataFrame):
+        pd.testing.assert_frame_equal(a.reset_index(drop=True), b.reset_index(drop=True))
+
+    first_year = int(world.panel["year"].min())
+    for y in (first_year, year, first_year - 1):    # last one is outside the data
+        same(world.snapshot(y), cube.snapshot(y))
+        same(world.snapshot(y, dropna_cols=names[:2]), cube.snapshot(y, dropna_cols=names[:2]))
+        same(world.full_snapshot(y), cube.full_snapshot(y))
+        same(world.full_snapshot(y, required=names[:2]), cube.full_snapshot(y, required=names[:2]))
+
+    codes = list(cube.country_codes[:10])
+    same(world.series(codes[0]), cube.series(codes[0]))
+    same(world.series(codes, names[:3]), cube.series(codes, names[:3]))
+    same(world.series(codes, names[:3], years=[first_year, year, year + 10]),
+         cube.series(codes, names[:3], years=[first_year, year, year + 10]))
+
+    # --- Aggregate: labelled by region and year on both backends, no reset ---
+    pd.testing.assert_frame_equal(world.region_mean(names[0]), cube.region_mean(names[0]))
+
+
+# -----------------------------------------------------------------------
+# ----------------------------- TIMING ----------------------------------
+# -----------------------------------------------------------------------
+
+
+def best_time(func, repeat: int) -> float:
+    # --- Best of `repeat` runs, in milliseconds ---
+    times = []
+    for _ in range(repeat):
+        t = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - t)
+    return min(times) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Storage benchmark: panel vs cube")
+    parser.add_argument("--indicators", type=int, default=1500)
+    parser.add_argument("--countries", type=int, default=217)
+    parser.add_argument("--years", type=int, default=64)
+    parser.add_argument("--missing", type=float, default=0.4, help="share of missing values")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    panel, meta, indicators = make_data(args.indicators, args.countries, args.years, args.missing)
+    names = list(indicators)
+    year = int(panel["year"].max()) - 2
+    first_year = int(panel["year"].min())
+
+    print(f"{args.indicators} indicators x {args.countries} countries x {args.years} years "
+          f"({panel.shape[0]:,} panel rows)")
+
+    t = time.perf_counter()
+    world = WorldDataset(panel, meta, indicators)
+    t_panel = time.perf_counter() - t
+    t = time.perf_counter()
+    cube = WorldCube(panel, meta, indicators)
+    t_cube = time.perf_counter() - t
+    print(f"Build: panel {t_panel:.2f} s, cube {t_cube:.2f} s (cube includes the panel)")
+
+    check_parity(world, cube, year, names)
+
+    # --- Also with country-years missing from the panel ---
+    sub = panel.sample(frac=0.9, random_state=0)
+    check_parity(WorldDataset(sub, meta, indicators), WorldCube(sub, meta, indicators), year, names)
+    print("Parity: snapshot, full_snapshot, series and region_mean are identical on both backends\n")
+
+    # --- Same call on both backends ---
+    cases = {
+        "snapshot(year)":
+            lambda w: w.snapshot(year),
+        "full_snapshot(year, required=2)":
+            lambda w: w.full_snapshot(year, required=names[:2]),
+        "series(1 country, all)":
+            lambda w: w.series(cube.country_codes[len(cube.country_codes) // 2]),
+        "series(10 countries, 3 ind.)":
+            lambda w: w.series(list(cube.country_codes[:10]), names[:3]),
+        "cagr(1 ind., all countries)":
+            lambda w: w.cagr(names[0], first_year, year),
+        "region_mean(1 ind.)":
+            lambda w: w.region_mean(names[0]),
+    }
+
+    print(f"{'operation':<34}{'panel (ms)':>12}{'cube (ms)':>12}{'speedup':>10}")
+    for label, case in cases.items():
+        slow = best_time(lambda: case(world), args.repeat)
+        fast = best_time(lambda: case(cube), args.repeat)
+        print(f"{label:<34}{slow:>12.2f}{fast:>12.2f}{slow / fast:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,17 +1,13 @@
 # --- IMPORT PACKAGES ---
 import sys
 
-from sklearn.linear_model import LinearRegression
-
 sys.path.append(".")   # go up one directory so Python sees Librarian/
 
-from Librarian.data_loader import load_world
+from Librarian.data_loader import load_world, load_scatter_payload
+from Librarian.charts import animated_scatter
+from Librarian.models import LinearFit
 from Librarian.config import REGION_PALETTE, REGION_NAME_MAP
-import matplotlib.pyplot as plt
-import seaborn as sns
 import streamlit as st
-import numpy as np
-from sklearn.metrics import r2_score
 
 
 
@@ -34,27 +30,32 @@ col_left, col_right = st.columns([3, 2])
 # Create the slider
 with col_right:
     st.subheader("Options")
-    year = st.slider("Select a year", min_value=2000, max_value=2022, value=2000, step=1)
+    # Interactive mode: all years are sent once, year and regions are then changed in the browser
+    interactive = st.checkbox("Interactive mode (year and regions in the chart)", value=False)
+    if not interactive:
+        year = st.slider("Select a year", min_value=2000, max_value=2022, value=2000, step=1)
 
 # --- BUILD SNAPSHOT FOR SELECTED YEAR ---
 
-snapshot = world.full_snapshot(year,required=["energy_use_per_capita", "co2_per_capita"])
+if not interactive:
+    snapshot = world.full_snapshot(year,required=["energy_use_per_capita", "co2_per_capita"])
 
 
 
 with col_right:
-    # Region filter
-    all_regions = sorted(snapshot["region_name"].dropna().unique())
-    selected_regions = st.multiselect(
-        "Choose regions to plot",
-        options=all_regions,
-        default=all_regions,
-    )
+    if not interactive:
+        # Region filter
+        all_regions = sorted(snapshot["region_name"].dropna().unique())
+        selected_regions = st.multiselect(
+            "Choose regions to plot",
+            options=all_regions,
+            default=all_regions,
+        )
 
     # Linear regression button
     show_linear = st.checkbox("Linear regression", value=False)
 
-if selected_regions:  # if user deselects everything, keep empty
+if not interactive and selected_regions:  # if user deselects everything, keep empty
     snapshot = snapshot[snapshot["region_name"].isin(selected_regions)]
 
 with col_right:
@@ -71,7 +72,31 @@ with col_right:
 
 
 
+# --- CLIENT-SIDE CHART ---
+if interactive:
+    payload = load_scatter_payload(
+        "energy_use_per_capita", "co2_per_capita",
+        fit="linear" if show_linear else None,
+    )
+    chart = animated_scatter(
+        payload,
+        x_title="Energy consumption per capita (kWh / year)",
+        y_title="CO2 Emission per capita (eq. Ton / year)",
+        x_domain=[0, 220000],
+        y_domain=[0, 50],
+        title="Energy consumption and CO2 emissions",
+    )
+    with col_left:
+        st.altair_chart(chart, use_container_width=True)
+        st.caption("Click a region in the legend to isolate it (shift+click for more). "
+                   "The linear fit is computed on all regions.")
+    st.stop()
+
+
 # --- PLOT SCATTER ---
+# Plotting libraries are imported only when the chart is drawn
+import matplotlib.pyplot as plt
+import seaborn as sns
 
 fig, ax = plt.subplots(figsize=(6.5, 4)) # Dimesions
 sns.scatterplot(
@@ -90,22 +115,19 @@ ax.set_ylabel("CO2 Emission per capita (eq. Ton / year)")
 
 # --- Regression line ---
 if show_linear and not snapshot.empty:
-    X = snapshot["energy_use_per_capita"].values.reshape(-1, 1)
-    y = snapshot["co2_per_capita"].values
+    x = snapshot["energy_use_per_capita"]
+    y = snapshot["co2_per_capita"]
 
-    model = LinearRegression()
-    model.fit(X, y)
+    fit = LinearFit.fit(x=x, y=y)
 
-    x_fit = np.linspace(X.min(), X.max(), 200)
-    y_fit = model.predict(x_fit.reshape(-1, 1))
-    r2 = r2_score(y, model.predict(X))
+    x_fit, y_fit = fit.curve(x_min=x.min(), x_max=x.max(), n=200)
 
     ax.plot(
         x_fit,
         y_fit,
         color="blue",
         linewidth=2,
-        label=f"Linear fit (R² = {r2:.2f})",
+        label=f"Linear fit (R² = {fit.r2:.2f})",
     )
 
 
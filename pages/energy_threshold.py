@@ -5,8 +5,6 @@ sys.path.append("..")   # go up one directory so Python sees Librarian/
 from Librarian.data_loader import load_world
 from Librarian.models import WorldDataset, CobbDouglasFit
 from Librarian.config import REGION_PALETTE, REGION_NAME_MAP
-import matplotlib.pyplot as plt
-import seaborn as sns
 import streamlit as st
 
 
@@ -97,6 +95,9 @@ with col_right:
 
 
 # ------------- PLOT SCATTER --------------------------
+# Plotting libraries are imported only when the chart is drawn
+import matplotlib.pyplot as plt
+import seaborn as sns
 
 fig, ax = plt.subplots(figsize=(6.5, 4)) # Dimesions
 sns.scatterplot(
@@ -0,0 +1,108 @@
+# --- IMPORT PACKAGES ---
+import sys
+sys.path.append(".")   # go up one directory so Python sees Librarian/
+
+from Librarian.data_loader import load_world
+import streamlit as st
+
+
+# --- Charts available: y-axis indicator and its label (x-axis is always energy use) ---
+CHARTS = {
+    "Energy and Life expectancy": ("life_expectancy", "Life expectancy (years)"),
+    "Energy and CO2 emissions": ("co2_per_capita", "CO2 Emission per capita (eq. Ton / year)"),
+}
+
+DEFAULT_COUNTRIES = ["China", "India", "United States", "Germany", "Nigeria", "Brazil"]
+
+
+
+# --- APP LAYOUT ---
+# Load dataset (cached)
+world = load_world()
+
+# Main layout
+st.set_page_config(layout="wide")
+st.title("Where are countries heading?")
+st.markdown("""The chart follows each selected country over time: every point is one year,
+the line connects the years from the first (hollow marker) to the last (filled marker).""")
+
+col_left, col_right = st.columns([3, 2])
+
+# Countries with data, by name
+countries = world.meta[world.meta["id"].isin(world.panel["country_code"].unique())]
+name_to_code = dict(zip(countries["name"], countries["id"]))
+code_to_name = dict(zip(countries["id"], countries["name"]))
+
+# --------- DATA INPUTS ------------
+
+with col_right:
+    st.subheader("Options")
+    chart = st.radio("Chart", options=list(CHARTS))
+    start_year, end_year = st.slider("Select the years", min_value=2000, max_value=2022, value=(2000, 2022), step=1)
+    selected = st.multiselect(
+        "Choose countries to plot",
+        options=sorted(name_to_code),
+        default=[name for name in DEFAULT_COUNTRIES if name in name_to_code],
+    )
+    use_log_scale = st.checkbox("Log scale on energy axis", value=False)
+
+y_col, y_label = CHARTS[chart]
+codes = [name_to_code[name] for name in selected]
+
+if not codes:
+    st.warning("Select at least one country.")
+    st.stop()
+
+# --- Time series of the selected countries (read from the country index) ---
+paths = world.series(codes, ["energy_use_per_capita", y_col], years=range(start_year, end_year + 1))
+paths = paths.dropna()
+
+
+# ------------- PLOT TRAJECTORIES --------------------------
+# Plotting library is imported only when the chart is drawn
+import matplotlib.pyplot as plt
+
+fig, ax = plt.subplots(figsize=(6.5, 4)) # Dimesions
+
+for code, path in paths.groupby("country_code", sort=False):
+    line, = ax.plot(
+        path["energy_use_per_capita"],
+        path[y_col],
+        linewidth=1.5,
+        alpha=0.8,
+        label=code_to_name.get(code, code),
+    )
+    # First year hollow, last year filled
+    ax.scatter(path["energy_use_per_capita"].iloc[0], path[y_col].iloc[0],
+               s=30, facecolors="none", edgecolors=line.get_color())
+    ax.scatter(path["energy_use_per_capita"].iloc[-1], path[y_col].iloc[-1],
+               s=30, color=line.get_color())
+
+ax.set_xlabel("Energy consumption per capita (kWh / year)")
+ax.set_ylabel(y_label)
+
+if use_log_scale:
+    ax.set_xscale("log")
+
+ax.set_title(f"{chart} ({start_year}–{end_year})")
+ax.grid(alpha=0.3)
+ax.legend(title="Country", loc="best", fontsize=5)
+
+with col_left:
+    st.pyplot(fig, use_container_width=False)
+
+
+# -------------------- GROWTH OVER THE WINDOW -------------------------
+
+with col_right:
+    st.subheader("Average growth per year")
+    if end_year > start_year:
+        cagr = world.cagr(["energy_use_per_capita", y_col], start_year, end_year, countries=codes)
+        cagr = (cagr * 100).round(2)
+        cagr.index = [code_to_name.get(code, code) for code in cagr.index]
+        cagr.columns = ["Energy use (%/year)", f"{y_label.split(' (')[0]} (%/year)"]
+        st.dataframe(cagr)
+        st.caption(f"Compound annual growth rate between {start_year} and {end_year}. "
+                   "Empty cells: no data for one of the two years.")
+    else:
+        st.write("Select at least two different years.")
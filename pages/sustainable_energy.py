@@ -1,5 +1,4 @@
 import sys
-import matplotlib.pyplot as plt
 import streamlit as st
 
 sys.path.append(".")
@@ -23,13 +22,23 @@ st.write("The chart shows the electricity production by nuclear fission and rene
 col_left, col_right = st.columns([3, 2])
 
 with col_right:
-    year = st.slider("Year", 2000, 2021, 2021)
+    year = st.slider("Year", 2000, 2022, 2021)
+    # Gap-filled data: interpolated between two observations, or last value carried forward
+    fill_missing = st.checkbox("Fill missing years", value=True)
 
 # --- Take snapshot for that year ---
-snapshot = world.full_snapshot(year)
+snapshot = world.full_snapshot(year, filled=fill_missing)
+
+# Countries with at least one estimated value
+if fill_missing:
+    snapshot["imputed"] = (
+        snapshot["renewable_electricity_share_nohydro_imputed"] | snapshot["nuclear_electricity_share_imputed"]
+    )
+else:
+    snapshot["imputed"] = False
 
 # creating another snapshot to avoid empty dataframe problems
-cols_needed = ["name", "renewable_electricity_share_nohydro", "nuclear_electricity_share"]
+cols_needed = ["name", "renewable_electricity_share_nohydro", "nuclear_electricity_share", "imputed"]
 snapshot_sub = snapshot[cols_needed].copy()
 
 snapshot_sub = snapshot_sub.dropna(
@@ -59,13 +68,16 @@ else:
     if top20.empty:
         st.warning("No country passes the filters for this year.")
     else:
-        countries = top20["name"]
+        countries = top20["name"].where(~top20["imputed"], top20["name"] + " *")
         renew = top20["renew"]
         nuc = top20["nuc"]
 
 # ---------- PLOT GRAPH ---------------------
 
         with col_left:
+            # Plotting library is imported only when the chart is drawn
+            import matplotlib.pyplot as plt
+
             fig, ax = plt.subplots(figsize=(6.5, 5))
 
             ax.barh(
@@ -93,6 +105,8 @@ else:
 
             plt.tight_layout()
             st.pyplot(fig)
+            if top20["imputed"].any():
+                st.caption("* Estimated value: missing year filled from the nearest observations.")
 
 # ------ INTERPRETATION -----------------
 